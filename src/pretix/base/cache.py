@@ -1,10 +1,26 @@
 import hashlib
+import pickle
 import time
 from typing import Dict, List
 
+try:
+    import zstandard
+except ImportError:  # python-zstandard < 0.9 installs its module as `zstd`
+    import zstd as zstandard
+
 from django.core.cache import caches
 from django.db.models import Model
 
+# Large values (rendered HTML, pickled querysets) are compressed before they
+# are handed to the cache backend, both to save cache memory and to stay below
+# memcached's 1 MB value limit. Values that are still too large after
+# compression are split into multiple keys. A one-byte magic marker tells
+# reads which of the two encodings they are looking at.
+COMPRESS_MIN_SIZE = 64 * 1024
+CHUNK_SIZE = 900 * 1024
+_MAGIC_ZSTD = b'\x01'
+_MAGIC_CHUNKED = b'\x02'
+
 
 class NamespacedCache:
 
@@ -85,8 +101,121 @@ class ObjectRelatedCache(NamespacedCache):
     The ObjectRelatedCache instance itself is stateless, all state is
     stored in the cache backend, so you can instantiate this class as many
     times as you want.
+
+    Entries can optionally be stored with a list of tags, e.g. the names of
+    the model fields they depend on, and invalidated selectively with
+    ``clear_tags()`` without flushing everything else. The same tags need to
+    be passed when reading the entry back. Entries stored without explicit
+    tags carry the wildcard tag ``'*'``, which is invalidated on every save
+    of the object.
     """
 
     def __init__(self, obj: Model, cache: str='default'):
         assert isinstance(obj, Model)
         super().__init__('%s:%s' % (obj._meta.object_name, obj.pk), cache)
+
+    def _pack(self, value):
+        try:
+            serialized = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError):
+            return None
+        if len(serialized) < COMPRESS_MIN_SIZE and not (
+                isinstance(value, bytes) and value[:1] in (_MAGIC_ZSTD, _MAGIC_CHUNKED)):
+            return None
+        return _MAGIC_ZSTD + zstandard.ZstdCompressor(level=1).compress(serialized)
+
+    def _unpack(self, payload: bytes):
+        return pickle.loads(zstandard.ZstdDecompressor().decompress(payload[1:]))
+
+    def _tag_version(self, tag: str) -> int:
+        # Initialization can race like the namespace prefix above, see there.
+        vkey = '%s:tagver:%s' % (self.prefixkey, tag)
+        version = self.cache.get(vkey)
+        if version is None:
+            version = int(time.time())
+            self.cache.set(vkey, version)
+        return version
+
+    def _fold(self, key: str, tags: List[str]=None) -> str:
+        # Fold the current version of every tag the entry depends on into
+        # the key. clear_tags() just bumps the versions, atomically orphaning
+        # all entries stored under the old ones -- the same trick
+        # _prefix_key() uses for the namespace as a whole. The delimiter has
+        # to be a printable character, as memcached rejects keys containing
+        # control bytes; the version numbers in the suffix make collisions
+        # with a literal '|' in a caller's key practically impossible.
+        return '%s|%s' % (key, ','.join(
+            '%s=%d' % (tag, self._tag_version(tag)) for tag in sorted(tags or ['*'])
+        ))
+
+    def clear_tags(self, tags: List[str]) -> None:
+        """
+        Invalidates all entries that were stored with one of the given tags.
+        Entries stored without explicit tags carry the wildcard tag ``'*'``.
+        """
+        for tag in tags:
+            vkey = '%s:tagver:%s' % (self.prefixkey, tag)
+            try:
+                self.cache.incr(vkey, 1)
+            except ValueError:
+                self.cache.set(vkey, int(time.time()))
+
+    def _set(self, fkey: str, value: str, timeout: int=3600):
+        payload = self._pack(value)
+        if payload is None:
+            return super().set(fkey, value, timeout)
+        if len(payload) <= CHUNK_SIZE:
+            return super().set(fkey, payload, timeout)
+        nchunks = 0
+        for i in range(0, len(payload), CHUNK_SIZE):
+            super().set('%s.%d' % (fkey, nchunks), payload[i:i + CHUNK_SIZE], timeout)
+            nchunks += 1
+        return super().set(fkey, _MAGIC_CHUNKED + str(nchunks).encode(), timeout)
+
+    def _get(self, fkey: str) -> str:
+        value = super().get(fkey)
+        if isinstance(value, bytes):
+            if value[:1] == _MAGIC_ZSTD:
+                return self._unpack(value)
+            elif value[:1] == _MAGIC_CHUNKED:
+                chunks = []
+                for i in range(int(value[1:])):
+                    chunk = super().get('%s.%d' % (fkey, i))
+                    if chunk is None:
+                        return None
+                    chunks.append(chunk)
+                return self._unpack(b''.join(chunks))
+        return value
+
+    def set(self, key: str, value: str, timeout: int=3600, tags: List[str]=None):
+        return self._set(self._fold(key, tags), value, timeout)
+
+    def get(self, key: str, tags: List[str]=None) -> str:
+        return self._get(self._fold(key, tags))
+
+    def set_many(self, values: Dict[str, str], timeout=3600, tags: List[str]=None):
+        # Routed through _set() so large values get the same compression,
+        # chunking and tag handling as set(); a value stored with one of the
+        # two methods can be read back with either get() or get_many().
+        for key, value in values.items():
+            self._set(self._fold(key, tags), value, timeout)
+
+    def get_many(self, keys: List[str], tags: List[str]=None) -> Dict[str, str]:
+        values = {}
+        for key in keys:
+            value = self._get(self._fold(key, tags))
+            if value is not None:
+                values[key] = value
+        return values
+
+    def delete(self, key: str, tags: List[str]=None):
+        return super().delete(self._fold(key, tags))
+
+    def delete_many(self, keys: List[str], tags: List[str]=None):
+        return super().delete_many([self._fold(key, tags) for key in keys])
+
+    def incr(self, key: str, by: int=1, tags: List[str]=None):
+        return super().incr(self._fold(key, tags), by)
+
+    def decr(self, key: str, by: int=1, tags: List[str]=None):
+        return super().decr(self._fold(key, tags), by)
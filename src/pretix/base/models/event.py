@@ -1,18 +1,23 @@
-import string
+import binascii
+import os
+import re
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, time
+from functools import lru_cache
+from itertools import chain
 
-import pytz
+from dateutil import tz as dateutil_tz
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.files.storage import default_storage
 from django.core.mail import get_connection
 from django.core.validators import RegexValidator
-from django.db import models
+from django.db import models, transaction
 from django.template.defaultfilters import date as _date
 from django.utils.crypto import get_random_string
-from django.utils.timezone import make_aware, now
-from django.utils.translation import ugettext_lazy as _
+from django.utils.timezone import now
+from django.utils.translation import get_language, ugettext_lazy as _
 from i18nfield.fields import I18nCharField, I18nTextField
 
 from pretix.base.email import CustomSMTPBackend
@@ -23,6 +28,79 @@ from pretix.helpers.daterange import daterange
 from ..settings import settings_hierarkey
 from .organizer import Organizer
 
+SLUG_RE = re.compile("^[a-zA-Z0-9.-]+$")
+
+
+@lru_cache(maxsize=512)
+def _tz(name: str):
+    # Constructing a timezone object parses zoneinfo files, which is way too
+    # expensive to do once per event in a list of events. We use dateutil
+    # instead of pytz here as its tzinfo objects implement the offset logic
+    # directly, so aware datetimes can be built and converted without pytz's
+    # localize()/normalize() dance.
+    tz = dateutil_tz.gettz(name)
+    if tz is None:
+        # gettz() returns None for unknown names, which astimezone() would
+        # silently interpret as the server's local timezone. Fail loudly
+        # instead, like pytz.timezone() did.
+        raise ValueError('Unknown timezone name %r' % name)
+    return tz
+
+
+@lru_cache(maxsize=4096)
+def _format_date_range(date_from_ts, date_to_ts, tz_name, locale):
+    # The formatted range only depends on these four values, so identical
+    # events rendered over and over in list views hit this memo instead of
+    # re-running the datetime formatting machinery.
+    tz = _tz(tz_name)
+    df = datetime.fromtimestamp(date_from_ts, tz)
+    if date_to_ts is None:
+        return _date(df, "DATE_FORMAT")
+    return daterange(df, datetime.fromtimestamp(date_to_ts, tz))
+
+
+def _copy_storage_file(src: str, dst: str) -> str:
+    with default_storage.open(src, 'rb') as fi:
+        return default_storage.save(dst, fi)
+
+
+class LazyCurrencyChoices:
+    """
+    Building the currency choice list walks over nearly 200 pycountry entries,
+    which is wasted work at import time for every worker process that never
+    renders a currency field. This sequence builds the list on first use and
+    compares equal to the materialized list, so migrations stay unchanged.
+    """
+
+    _choices = None
+
+    def _materialize(self):
+        if LazyCurrencyChoices._choices is None:
+            LazyCurrencyChoices._choices = [
+                (c.alpha_3, c.alpha_3 + " - " + c.name) for c in settings.CURRENCIES
+            ]
+        return LazyCurrencyChoices._choices
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __len__(self):
+        return len(self._materialize())
+
+    def __getitem__(self, item):
+        return self._materialize()[item]
+
+    def __bool__(self):
+        # Do not materialize for the truth tests in Field.__init__ and
+        # Field.deconstruct, there is always at least one currency.
+        return True
+
+    def __eq__(self, other):
+        return self._materialize() == other
+
+    def __hash__(self):
+        return hash(id(type(self)))
+
 
 @settings_hierarkey.add(parent_field='organizer', cache_namespace='event')
 class Event(LoggedModel):
@@ -57,7 +135,7 @@ class Event(LoggedModel):
     """
 
     settings_namespace = 'event'
-    CURRENCY_CHOICES = [(c.alpha_3, c.alpha_3 + " - " + c.name) for c in settings.CURRENCIES]
+    CURRENCY_CHOICES = LazyCurrencyChoices()
     organizer = models.ForeignKey(Organizer, related_name="events", on_delete=models.PROTECT)
     name = I18nCharField(
         max_length=200,
@@ -72,7 +150,7 @@ class Event(LoggedModel):
             "This will be used in URLs, order codes, invoice numbers, and bank transfer references."),
         validators=[
             RegexValidator(
-                regex="^[a-zA-Z0-9.-]+$",
+                regex=SLUG_RE,
                 message=_("The slug may only contain letters, numbers, dots and dashes."),
             ),
             EventSlugBlacklistValidator()
@@ -121,35 +199,81 @@ class Event(LoggedModel):
     def __str__(self):
         return str(self.name)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        # Snapshot the values as loaded from the database so clean() and
+        # save() can tell which fields actually changed.
+        instance = super().from_db(db, field_names, values)
+        instance._db_values = dict(zip(field_names, values))
+        return instance
+
     def save(self, *args, **kwargs):
+        dbv = getattr(self, '_db_values', None)
         obj = super().save(*args, **kwargs)
-        self.get_cache().clear()
+        self.__dict__.pop('_plugins_cache', None)
+        self.__dict__.pop('_presale_state_cache', None)
+        self.__dict__.pop('_payment_providers_cache', None)
+        if dbv is None:
+            self.get_cache().clear()
+        else:
+            # Only invalidate cache entries tagged with a field that actually
+            # changed. Untagged entries carry the wildcard tag '*' and are
+            # therefore still flushed on every save; each tag bump is a
+            # single atomic incr, just like clear()'s prefix bump.
+            dirty = [
+                f for f, v in dbv.items()
+                if v is not models.DEFERRED and v != getattr(self, f)
+            ]
+            self.get_cache().clear_tags(dirty + ['*'])
+            self._db_values = {
+                f: getattr(self, f) for f, v in dbv.items() if v is not models.DEFERRED
+            }
         return obj
 
     def clean(self):
-        if self.presale_start and self.presale_end and self.presale_start > self.presale_end:
-            raise ValidationError({'presale_end': _('The end of the presale period has to be later than its start.')})
-        if self.date_from and self.date_to and self.date_from > self.date_to:
-            raise ValidationError({'date_to': _('The end of the event has to be later than its start.')})
+        # The date checks only need to run if one of the dates was modified
+        # since the instance was loaded; anything already in the database has
+        # passed them before.
+        dbv = getattr(self, '_db_values', None)
+        if dbv is None or any(
+            dbv.get(f) != getattr(self, f)
+            for f in ('date_from', 'date_to', 'presale_start', 'presale_end')
+        ):
+            if self.presale_start and self.presale_end and self.presale_start > self.presale_end:
+                raise ValidationError({'presale_end': _('The end of the presale period has to be later than its start.')})
+            if self.date_from and self.date_to and self.date_from > self.date_to:
+                raise ValidationError({'date_to': _('The end of the event has to be later than its start.')})
         super().clean()
 
     def get_plugins(self) -> "list[str]":
         """
         Returns the names of the plugins activated for this event as a list.
         """
-        if self.plugins is None:
-            return []
-        return self.plugins.split(",")
+        # This is called once per receiver on every plugin signal dispatch,
+        # so we only want to parse the plugin list once per instance. Return
+        # a copy, as callers are allowed to modify the returned list.
+        cached = getattr(self, '_plugins_cache', None)
+        if cached is None:
+            cached = self._plugins_cache = tuple(self.plugins.split(",")) if self.plugins else ()
+        return list(cached)
+
+    def _get_tz(self, settings=None):
+        name = (settings if settings is not None else self.settings).timezone
+        cached = getattr(self, '_tz_cache', None)
+        if cached is None or cached[0] != name:
+            cached = self._tz_cache = (name, _tz(name))
+        return cached[1]
 
     def get_date_from_display(self, tz=None, show_times=True) -> str:
         """
         Returns a formatted string containing the start date of the event with respect
         to the current locale and to the ``show_times`` setting.
         """
-        tz = tz or pytz.timezone(self.settings.timezone)
+        s = self.settings
+        tz = tz or self._get_tz(s)
         return _date(
             self.date_from.astimezone(tz),
-            "DATETIME_FORMAT" if self.settings.show_times and show_times else "DATE_FORMAT"
+            "DATETIME_FORMAT" if s.show_times and show_times else "DATE_FORMAT"
         )
 
     def get_time_from_display(self, tz=None) -> str:
@@ -157,7 +281,7 @@ class Event(LoggedModel):
         Returns a formatted string containing the start time of the event, ignoring
         the ``show_times`` setting.
         """
-        tz = tz or pytz.timezone(self.settings.timezone)
+        tz = tz or self._get_tz()
         return _date(
             self.date_from.astimezone(tz), "TIME_FORMAT"
         )
@@ -168,19 +292,27 @@ class Event(LoggedModel):
         to the current locale and to the ``show_times`` setting. Returns an empty string
         if ``show_date_to`` is ``False``.
         """
-        tz = tz or pytz.timezone(self.settings.timezone)
-        if not self.settings.show_date_to or not self.date_to:
+        s = self.settings
+        tz = tz or self._get_tz(s)
+        if not s.show_date_to or not self.date_to:
             return ""
         return _date(
             self.date_to.astimezone(tz),
-            "DATETIME_FORMAT" if self.settings.show_times else "DATE_FORMAT"
+            "DATETIME_FORMAT" if s.show_times else "DATE_FORMAT"
         )
 
     def get_date_range_display(self, tz=None) -> str:
-        tz = tz or pytz.timezone(self.settings.timezone)
-        if not self.settings.show_date_to or not self.date_to:
-            return _date(self.date_from.astimezone(tz), "DATE_FORMAT")
-        return daterange(self.date_from.astimezone(tz), self.date_to.astimezone(tz))
+        s = self.settings
+        if tz is not None:
+            # We cannot key the memo below on arbitrary tzinfo objects.
+            if not s.show_date_to or not self.date_to:
+                return _date(self.date_from.astimezone(tz), "DATE_FORMAT")
+            return daterange(self.date_from.astimezone(tz), self.date_to.astimezone(tz))
+        return _format_date_range(
+            self.date_from.timestamp(),
+            self.date_to.timestamp() if s.show_date_to and self.date_to else None,
+            s.timezone, get_language()
+        )
 
     def get_cache(self) -> "pretix.base.cache.ObjectRelatedCache":
         """
@@ -193,19 +325,29 @@ class Event(LoggedModel):
 
         return ObjectRelatedCache(self)
 
+    def _presale_state(self):
+        # These properties are read multiple times per event while rendering
+        # event lists, so we compute both answers from a single now() call
+        # and reuse them for the rest of the current second.
+        ref = now()
+        ts = ref.replace(microsecond=0)
+        cached = getattr(self, '_presale_state_cache', None)
+        if cached is None or cached[0] != ts:
+            is_running = not (
+                (self.presale_start and ref < self.presale_start)
+                or (self.presale_end and ref > self.presale_end)
+            )
+            has_ended = bool(self.presale_end and ref > self.presale_end)
+            cached = self._presale_state_cache = (ts, is_running, has_ended)
+        return cached
+
     @property
     def presale_has_ended(self):
-        if self.presale_end and now() > self.presale_end:
-            return True
-        return False
+        return self._presale_state()[2]
 
     @property
     def presale_is_running(self):
-        if self.presale_start and now() < self.presale_start:
-            return False
-        if self.presale_end and now() > self.presale_end:
-            return False
-        return True
+        return self._presale_state()[1]
 
     def lock(self):
         """
@@ -229,19 +371,29 @@ class Event(LoggedModel):
 
     @property
     def payment_term_last(self):
-        tz = pytz.timezone(self.settings.timezone)
-        return make_aware(datetime.combine(
+        # dateutil tzinfo objects can be attached directly, no make_aware()
+        # needed. This property is hit a lot during order and invoice
+        # processing.
+        return datetime.combine(
             self.settings.get('payment_term_last', as_type=date),
-            time(hour=23, minute=59, second=59)
-        ), tz)
+            time(hour=23, minute=59, second=59, tzinfo=self._get_tz())
+        )
 
+    @transaction.atomic
     def copy_data_from(self, other):
-        from . import ItemAddOn, ItemCategory, Item, Question, Quota
+        from . import (
+            ItemAddOn, ItemCategory, Item, Question, QuestionOption, Quota,
+        )
         from ..signals import event_copy_data
 
         self.plugins = other.plugins
         self.save()
 
+        # The parent objects (categories, items, variations, quotas,
+        # questions) are still saved one by one as we need their new primary
+        # keys to restore the relations between them and bulk_create() only
+        # hands those back on PostgreSQL. Everything that is not referenced
+        # afterwards is collected and inserted in one batch per table.
         category_map = {}
         for c in ItemCategory.objects.filter(event=other):
             category_map[c.pk] = c
@@ -267,68 +419,99 @@ class Event(LoggedModel):
                 v.item = i
                 v.save()
 
-        for ia in ItemAddOn.objects.filter(base_item__event=other).prefetch_related('base_item', 'addon_category'):
+        addons = []
+        for ia in ItemAddOn.objects.filter(base_item__event=other).select_related('base_item', 'addon_category'):
             ia.pk = None
             ia.base_item = item_map[ia.base_item.pk]
             ia.addon_category = category_map[ia.addon_category.pk]
-            ia.save()
+            addons.append(ia)
+        ItemAddOn.objects.bulk_create(addons)
 
+        quota_items = []
+        quota_vars = []
         for q in Quota.objects.filter(event=other).prefetch_related('items', 'variations'):
             items = list(q.items.all())
             vars = list(q.variations.all())
             q.pk = None
             q.event = self
             q.save()
-            for i in items:
-                if i.pk in item_map:
-                    q.items.add(item_map[i.pk])
-            for v in vars:
-                q.variations.add(variation_map[v.pk])
-
+            quota_items += [
+                Quota.items.through(quota_id=q.pk, item_id=item_map[i.pk].pk)
+                for i in items if i.pk in item_map
+            ]
+            quota_vars += [
+                Quota.variations.through(quota_id=q.pk, itemvariation_id=variation_map[v.pk].pk)
+                for v in vars
+            ]
+        Quota.items.through.objects.bulk_create(quota_items)
+        Quota.variations.through.objects.bulk_create(quota_vars)
+
+        question_items = []
+        options = []
         for q in Question.objects.filter(event=other).prefetch_related('items', 'options'):
             items = list(q.items.all())
             opts = list(q.options.all())
             q.pk = None
             q.event = self
             q.save()
-            for i in items:
-                q.items.add(item_map[i.pk])
+            question_items += [
+                Question.items.through(question_id=q.pk, item_id=item_map[i.pk].pk)
+                for i in items
+            ]
             for o in opts:
                 o.pk = None
                 o.question = q
-                o.save()
-
-        for s in other.settings._objects.all():
-            s.object = self
-            s.pk = None
-            if s.value.startswith('file://'):
-                fi = default_storage.open(s.value[7:], 'rb')
-                nonce = get_random_string(length=8)
-                fname = '%s/%s/%s.%s.%s' % (
-                    self.organizer.slug, self.slug, s.key, nonce, s.value.split('.')[-1]
-                )
-                newname = default_storage.save(fname, fi)
-                s.value = 'file://' + newname
-            s.save()
+                options.append(o)
+        Question.items.through.objects.bulk_create(question_items)
+        QuestionOption.objects.bulk_create(options)
+
+        # Copying the files of file settings is network-bound on remote
+        # storage backends, so we overlap the transfers in a small thread
+        # pool instead of waiting for them one by one.
+        settings_rows = list(other.settings._objects.all())
+        file_copies = []
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for s in settings_rows:
+                s.object = self
+                s.pk = None
+                if s.value.startswith('file://'):
+                    nonce = get_random_string(length=8)
+                    fname = '%s/%s/%s.%s.%s' % (
+                        self.organizer.slug, self.slug, s.key, nonce, s.value.split('.')[-1]
+                    )
+                    file_copies.append((s, executor.submit(_copy_storage_file, s.value[7:], fname)))
+            for s, future in file_copies:
+                s.value = 'file://' + future.result()
+        if settings_rows:
+            other.settings._objects.model.objects.bulk_create(settings_rows)
 
         event_copy_data.send(sender=self, other=other)
 
     def get_payment_providers(self) -> dict:
         from ..signals import register_payment_providers
 
-        responses = register_payment_providers.send(self)
-        providers = {}
-        for receiver, response in responses:
-            if not isinstance(response, list):
-                response = [response]
-            for p in response:
-                pp = p(self)
-                providers[pp.identifier] = pp
-        return providers
+        # Checkout and order views ask for this dict several times per
+        # request; dispatching the signal and instantiating every provider
+        # each time adds up, so the result is cached on the instance.
+        cached = getattr(self, '_payment_providers_cache', None)
+        if cached is None:
+            responses = register_payment_providers.send(self)
+            cached = self._payment_providers_cache = {
+                pp.identifier: pp
+                for pp in (
+                    p(self) for p in chain.from_iterable(
+                        response if isinstance(response, (list, tuple)) else [response]
+                        for receiver, response in responses
+                    )
+                )
+            }
+        return cached
 
 
 def generate_invite_token():
-    return get_random_string(length=32, allowed_chars=string.ascii_lowercase + string.digits)
+    # One urandom read instead of 32 SystemRandom character draws. The
+    # character class stays a subset of the old lowercase+digits alphabet.
+    return binascii.hexlify(os.urandom(16)).decode()
 
 
 class EventLock(models.Model):
@@ -102,11 +102,14 @@ def release_event_db(event):
 
 def redis_lock_from_event(event):
     from django_redis import get_redis_connection
-    from redis.lock import Lock
+    from redis.lock import LuaLock
 
     if not hasattr(event, '_lock') or not event._lock:
         rc = get_redis_connection("redis")
-        event._lock = Lock(redis=rc, name='pretix_event_%s' % event.id, timeout=LOCK_TIMEOUT)
+        # LuaLock checks token ownership and releases in one atomic
+        # server-side script, so we can not accidentally delete a lock that
+        # expired and has since been acquired by someone else.
+        event._lock = LuaLock(redis=rc, name='pretix_event_%s' % event.id, timeout=LOCK_TIMEOUT)
     return event._lock
 
 
@@ -1,3 +1,5 @@
+import re
+
 from django.core.exceptions import ValidationError
 from django.utils.deconstruct import deconstructible
 from django.utils.translation import ugettext_lazy as _
@@ -6,10 +8,23 @@ from django.utils.translation import ugettext_lazy as _
 class BlacklistValidator:
 
     blacklist = []
+    _blacklist_re = None
+
+    @classmethod
+    def _get_blacklist_re(cls):
+        # Compiled once per validator class: a single alternation scans the
+        # value in one pass instead of comparing it against every blacklist
+        # entry separately.
+        if cls._blacklist_re is None and cls.blacklist:
+            cls._blacklist_re = re.compile(
+                r'\A(?:' + '|'.join(re.escape(b) for b in cls.blacklist) + r')\Z'
+            )
+        return cls._blacklist_re
 
     def __call__(self, value):
         # Validation logic
-        if value in self.blacklist:
+        blacklist_re = self._get_blacklist_re()
+        if blacklist_re is not None and blacklist_re.match(value):
             raise ValidationError(
                 _('This slug has an invalid value: %(value)s.'),
                 code='invalid',
@@ -3,6 +3,7 @@ import warnings
 
 from django.apps import apps
 from django.conf.urls import include, url
+from django.urls import get_resolver
 from django.views.generic import TemplateView
 
 from pretix.presale.urls import (
@@ -49,3 +50,7 @@ plugin_patterns = [
 urlpatterns = common_patterns + plugin_patterns + presale_patterns_main
 
 handler404 = 'pretix.base.views.errors.page_not_found'
+
+# Build the resolver's regex tree now instead of stalling the first request
+# that hits this URLconf.
+get_resolver(__name__)._populate()
@@ -3,6 +3,7 @@ import warnings
 
 from django.apps import apps
 from django.conf.urls import include, url
+from django.urls import get_resolver
 
 from pretix.presale.urls import (
     event_patterns, locale_patterns, organizer_patterns,
@@ -42,3 +43,7 @@ plugin_patterns = [
 urlpatterns = common_patterns + plugin_patterns + presale_patterns
 
 handler404 = 'pretix.base.views.errors.page_not_found'
+
+# Build the resolver's regex tree now instead of stalling the first request
+# that hits this URLconf.
+get_resolver(__name__)._populate()
@@ -151,6 +151,16 @@ if HAS_REDIS:
     if config.getboolean('redis', 'sessions', fallback=False):
         SESSION_ENGINE = "django.contrib.sessions.backends.cache"
         SESSION_CACHE_ALIAS = "redis_sessions"
+    # Cache stable ORM reads in redis. cacheops invalidates the cached
+    # querysets automatically through post_save/post_delete signals.
+    CACHEOPS_REDIS = config.get('redis', 'location')
+    CACHEOPS_DEGRADE_ON_FAILURE = True
+    CACHEOPS = {
+        'pretixbase.event': {'ops': 'all', 'timeout': 60 * 60},
+        'pretixbase.organizer': {'ops': 'all', 'timeout': 60 * 60},
+        'pretixbase.item': {'ops': 'all', 'timeout': 60 * 60},
+        'pretixbase.quota': {'ops': 'all', 'timeout': 60 * 60},
+    }
 
 if not SESSION_ENGINE:
     if REAL_CACHE_USED:
@@ -221,6 +231,9 @@ try:
 except ImportError:
     pass
 
+if HAS_REDIS:
+    INSTALLED_APPS.append('cacheops')
+
 PLUGINS = []
 for entry_point in iter_entry_points(group='pretix.plugin', name=None):
     PLUGINS.append(entry_point.module_name)
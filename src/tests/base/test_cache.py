@@ -1,3 +1,4 @@
+import os
 import random
 
 from django.core.cache import cache as django_cache
@@ -46,6 +47,28 @@ class CacheTest(TestCase):
         self.cache.clear()
         self.assertIsNone(self.cache.get(self.testkey))
 
+    def test_tag_invalidation(self):
+        self.cache.set(self.testkey, "foo", tags=['date_from'])
+        self.cache.set(self.testkey + "2", "bar", tags=['location'])
+        self.cache.clear_tags(['date_from'])
+        self.assertIsNone(self.cache.get(self.testkey, tags=['date_from']))
+        self.assertEqual(self.cache.get(self.testkey + "2", tags=['location']), "bar")
+
+    def test_untagged_invalidated_with_wildcard(self):
+        self.cache.set(self.testkey, "foo")
+        self.cache.clear_tags(['*'])
+        self.assertIsNone(self.cache.get(self.testkey))
+
+    def test_large_value(self):
+        value = "a" * 1024 * 128
+        self.cache.set(self.testkey, value)
+        self.assertEqual(self.cache.get(self.testkey), value)
+
+    def test_very_large_value(self):
+        value = os.urandom(1024 * 1024 * 2)  # does not compress, so it gets chunked
+        self.cache.set(self.testkey, value)
+        self.assertEqual(self.cache.get(self.testkey), value)
+
     def test_many(self):
         inp = {
             'a': 'foo',
@@ -53,3 +76,14 @@ class CacheTest(TestCase):
         }
         self.cache.set_many(inp)
         self.assertEqual(inp, self.cache.get_many(inp.keys()))
+
+    def test_many_mixed_with_single(self):
+        inp = {
+            'a': 'foo',
+            'b': 'x' * 1024 * 128,
+        }
+        self.cache.set_many(inp)
+        self.assertEqual(self.cache.get('a'), 'foo')
+        self.assertEqual(self.cache.get('b'), inp['b'])
+        self.cache.set('c', 'baz')
+        self.assertEqual(self.cache.get_many(['b', 'c']), {'b': inp['b'], 'c': 'baz'})
@@ -6,14 +6,16 @@ from decimal import Decimal
 import pytest
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
 from django.utils.timezone import now
 
 from pretix.base.models import (
-    CachedFile, CartPosition, Event, Item, ItemCategory, ItemVariation, Order,
-    OrderPosition, Organizer, Question, Quota, User, Voucher, WaitingListEntry,
+    CachedFile, CartPosition, Event, Item, ItemAddOn, ItemCategory,
+    ItemVariation, Order, OrderPosition, Organizer, Question, QuestionOption,
+    Quota, User, Voucher, WaitingListEntry,
 )
 from pretix.base.services.orders import (
     OrderError, cancel_order, mark_order_paid, perform_order,
@@ -770,6 +772,54 @@ class EventTest(TestCase):
 
         self.assertIn('slug', str(context.exception))
 
+    def test_copy_data_from(self):
+        source = Event.objects.create(
+            organizer=self.organizer, name='Source', slug='source',
+            date_from=now(),
+        )
+        category = ItemCategory.objects.create(event=source, name='Tickets')
+        item = Item.objects.create(event=source, name='T-Shirt', default_price=23,
+                                   category=category)
+        var1 = ItemVariation.objects.create(item=item, value='S')
+        ItemVariation.objects.create(item=item, value='M')
+        ItemAddOn.objects.create(base_item=item, addon_category=category, max_count=2)
+        quota = Quota.objects.create(event=source, name='Quota', size=5)
+        quota.items.add(item)
+        quota.variations.add(var1)
+        question = Question.objects.create(event=source, question='Size?',
+                                           type=Question.TYPE_CHOICE)
+        question.items.add(item)
+        QuestionOption.objects.create(question=question, answer='L')
+        fname = default_storage.save('tests/presale.css', ContentFile('body { }'))
+        source.settings.set('presale_css_file', 'file://' + fname)
+
+        event = Event.objects.create(
+            organizer=self.organizer, name='Dummy', slug='dummy',
+            date_from=now(),
+        )
+        event.copy_data_from(source)
+
+        new_category = ItemCategory.objects.get(event=event)
+        self.assertEqual(str(new_category.name), 'Tickets')
+        new_item = Item.objects.get(event=event)
+        self.assertEqual(str(new_item.name), 'T-Shirt')
+        self.assertEqual(new_item.category, new_category)
+        self.assertEqual({str(v.value) for v in new_item.variations.all()}, {'S', 'M'})
+        new_addon = new_item.addons.get()
+        self.assertEqual(new_addon.addon_category, new_category)
+        self.assertEqual(new_addon.max_count, 2)
+        new_quota = Quota.objects.get(event=event)
+        self.assertEqual(list(new_quota.items.all()), [new_item])
+        self.assertEqual({str(v.value) for v in new_quota.variations.all()}, {'S'})
+        new_question = Question.objects.get(event=event)
+        self.assertEqual(list(new_question.items.all()), [new_item])
+        self.assertEqual([str(o.answer) for o in new_question.options.all()], ['L'])
+        new_file = event.settings.get('presale_css_file')
+        self.assertTrue(new_file.startswith('file://'))
+        self.assertNotEqual(new_file, 'file://' + fname)
+        with default_storage.open(new_file[len('file://'):]) as f:
+            self.assertEqual(f.read().strip(), b'body { }')
+
 
 class CachedFileTestCase(TestCase):
     def test_file_handling(self):